@@ -1,5 +1,29 @@
 import streamlit as st
-from ev_battery_system import EVBatterySystem
+from ev_battery_system import (CHARGER_POWERS, EVBatterySystem, capacity_per_percent,
+                               compute_charging_time, compute_cost_comparison,
+                               compute_degradation, compute_range)
+
+@st.cache_resource
+def get_ev(capacity):
+    return EVBatterySystem(battery_capacity_kwh=capacity)
+
+predict_range = st.cache_data(compute_range)
+calculate_charging_time = st.cache_data(compute_charging_time)
+calculate_battery_degradation = st.cache_data(compute_degradation)
+compare_ev_vs_ice = st.cache_data(compute_cost_comparison)
+
+def session_result(name, compute, **inputs):
+    """Return st.session_state[name], recomputing it only when the inputs changed"""
+    key = tuple(inputs.items())
+    if st.session_state.get(f"_{name}_inputs") != key:
+        st.session_state[name] = compute(**inputs)
+        st.session_state[f"_{name}_inputs"] = key
+    return st.session_state[name]
+
+def metric_row(metrics):
+    """Render (label, value) pairs as one row of st.metric columns"""
+    for col, (label, value) in zip(st.columns(len(metrics)), metrics):
+        col.metric(label, value)
 
 st.set_page_config(page_title="EV Battery Intelligence System", page_icon="🔋", layout="wide")
 st.title("🔋 EV Battery Intelligence System")
@@ -7,77 +31,94 @@ st.markdown("### Advanced Battery Management & Range Optimization")
 st.markdown("---")
 
 st.sidebar.header("⚙️ Battery Specifications")
-battery_capacity = st.sidebar.number_input("Battery Capacity (kWh)", min_value=20.0, max_value=200.0, value=60.0, step=5.0)
-battery_age = st.sidebar.number_input("Battery Age (years)", min_value=0.0, max_value=15.0, value=2.0, step=0.5)
-current_charge = st.sidebar.slider("Current Charge Level (%)", min_value=0, max_value=100, value=75)
+st.sidebar.number_input("Battery Capacity (kWh)", min_value=20.0, max_value=200.0, value=60.0, step=5.0, key="battery_capacity")
+st.sidebar.number_input("Battery Age (years)", min_value=0.0, max_value=15.0, value=2.0, step=0.5, key="battery_age")
+st.sidebar.slider("Current Charge Level (%)", min_value=0, max_value=100, value=75, key="current_charge")
 st.sidebar.markdown("---")
 st.sidebar.header("📊 Usage Patterns")
-cycles_per_year = st.sidebar.number_input("Charge Cycles per Year", min_value=50, max_value=500, value=200, step=10)
-fast_charge_usage = st.sidebar.slider("Fast Charging Usage (%)", min_value=0, max_value=100, value=30)
+st.sidebar.number_input("Charge Cycles per Year", min_value=50, max_value=500, value=200, step=10, key="cycles_per_year")
+st.sidebar.slider("Fast Charging Usage (%)", min_value=0, max_value=100, value=30, key="fast_charge_usage")
 
-ev = EVBatterySystem(battery_capacity_kwh=battery_capacity)
-ev.current_charge = current_charge
+ev = get_ev(st.session_state.battery_capacity)
 
-st.header("📊 Battery Health Analysis")
-degradation = ev.calculate_battery_degradation(years_used=battery_age, avg_cycles_per_year=cycles_per_year, fast_charge_percentage=fast_charge_usage)
-col1, col2, col3, col4 = st.columns(4)
-with col1: st.metric("State of Health", f"{degradation['current_soh']}%")
-with col2: st.metric("Degradation", f"{degradation['degradation_percentage']}%")
-with col3: st.metric("Health Status", degradation['health_status'])
-with col4: st.metric("Available Capacity", f"{ev.calculate_available_capacity():.1f} kWh")
+@st.fragment
+def health_section(ev):
+    st.header("📊 Battery Health Analysis")
+    degradation = session_result("degradation", calculate_battery_degradation, years_used=st.session_state.battery_age, avg_cycles_per_year=st.session_state.cycles_per_year, fast_charge_percentage=st.session_state.fast_charge_usage)
+    st.session_state.soh = degradation['current_soh']
+    st.session_state.capacity_per_pct = capacity_per_percent(ev.battery_capacity, st.session_state.soh)
+    metric_row([
+        ("State of Health", f"{degradation['current_soh']:.1f}%"),
+        ("Degradation", f"{degradation['degradation_percentage']:.1f}%"),
+        ("Health Status", degradation['health_status']),
+        ("Available Capacity", f"{st.session_state.capacity_per_pct * 100:.1f} kWh"),
+    ])
 
-st.markdown("---")
-st.header("🚗 Range Prediction")
-col1, col2 = st.columns(2)
-with col1:
-    speed = st.number_input("Average Speed (km/h)", 20, 160, 80, 5)
-    temperature = st.number_input("Temperature (°C)", -20, 50, 25, 1)
-    ac_usage = st.checkbox("AC Usage")
-with col2:
-    driving_style = st.selectbox("Driving Style", ["eco", "normal", "sport"])
-    terrain = st.selectbox("Terrain", ["flat", "hilly", "mountain"])
-
-range_data = ev.predict_range(speed_kmh=speed, temperature_c=temperature, ac_usage=ac_usage, driving_style=driving_style, terrain=terrain)
-col1, col2, col3 = st.columns(3)
-with col1: st.metric("Predicted Range", f"{range_data['range_km']} km")
-with col2: st.metric("Consumption", f"{range_data['consumption_per_100km']} kWh/100km")
-with col3: st.metric("Available Energy", f"{range_data['available_energy_kwh']} kWh")
+@st.fragment
+def range_section():
+    st.header("🚗 Range Prediction")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.number_input("Average Speed (km/h)", 20, 160, 80, 5, key="speed")
+        st.number_input("Temperature (°C)", -20, 50, 25, 1, key="temperature")
+        st.checkbox("AC Usage", key="ac_usage")
+    with col2:
+        st.selectbox("Driving Style", ["eco", "normal", "sport"], key="driving_style")
+        st.selectbox("Terrain", ["flat", "hilly", "mountain"], key="terrain")
 
-st.markdown("---")
-st.header("⚡ Charging Analysis")
-col1, col2 = st.columns(2)
-with col1:
-    target_charge = st.slider("Target Charge (%)", 0, 100, 100)
-with col2:
-    charger_type = st.selectbox("Charger Type", ["Home (3.7 kW)", "Fast Home (7.4 kW)", "DC Fast (50 kW)", "Ultra-Fast (150 kW)"])
-
-charger_powers = {"Home (3.7 kW)": 3.7, "Fast Home (7.4 kW)": 7.4, "DC Fast (50 kW)": 50, "Ultra-Fast (150 kW)": 150}
-charging_data = ev.calculate_charging_time(target_charge=target_charge, charger_power_kw=charger_powers[charger_type])
-col1, col2, col3 = st.columns(3)
-with col1: st.metric("Charging Time", f"{charging_data['charging_time_hours']:.1f} hours")
-with col2: st.metric("Minutes", f"{charging_data['charging_time_minutes']:.0f} min")
-with col3: st.metric("Energy Added", f"{charging_data['energy_added_kwh']:.1f} kWh")
+    range_data = session_result("range_data", predict_range, capacity_per_pct=st.session_state.capacity_per_pct, current_charge=st.session_state.current_charge, speed_kmh=st.session_state.speed, temperature_c=st.session_state.temperature, ac_usage=st.session_state.ac_usage, driving_style=st.session_state.driving_style, terrain=st.session_state.terrain)
+    metric_row([
+        ("Predicted Range", f"{range_data['range_km']:.2f} km"),
+        ("Consumption", f"{range_data['consumption_per_100km']:.2f} kWh/100km"),
+        ("Available Energy", f"{range_data['available_energy_kwh']:.2f} kWh"),
+    ])
 
+@st.fragment
+def charging_section():
+    st.header("⚡ Charging Analysis")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.slider("Target Charge (%)", 0, 100, 100, key="target_charge")
+    with col2:
+        st.selectbox("Charger Type", list(CHARGER_POWERS), key="charger_type")
+
+    charging_data = session_result("charging_data", calculate_charging_time, capacity_per_pct=st.session_state.capacity_per_pct, current_charge=st.session_state.current_charge, target_charge=st.session_state.target_charge, charger_power_kw=CHARGER_POWERS[st.session_state.charger_type])
+    metric_row([
+        ("Charging Time", f"{charging_data['charging_time_hours']:.1f} hours"),
+        ("Minutes", f"{charging_data['charging_time_minutes']:.0f} min"),
+        ("Energy Added", f"{charging_data['energy_added_kwh']:.1f} kWh"),
+    ])
+
+@st.fragment
+def cost_section():
+    st.header("💰 Cost Comparison: EV vs ICE")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.number_input("Annual Distance (km)", 5000, 50000, 15000, 1000, key="annual_km")
+        st.number_input("Petrol Price (₹/L)", 50.0, 200.0, 110.0, 5.0, key="petrol_price")
+    with col2:
+        st.number_input("Electricity Price (₹/kWh)", 2.0, 20.0, 8.0, 0.5, key="electricity_price")
+        st.number_input("ICE Efficiency (km/L)", 5.0, 30.0, 15.0, 1.0, key="ice_efficiency")
+
+    cost_comparison = session_result("cost_comparison", compare_ev_vs_ice, annual_km=st.session_state.annual_km, petrol_price_per_liter=st.session_state.petrol_price/100, electricity_price_per_kwh=st.session_state.electricity_price/100, ice_fuel_efficiency=st.session_state.ice_efficiency)
+    metric_row([
+        ("EV Annual Cost", f"₹{cost_comparison['ev_annual_cost']*100:,.0f}"),
+        ("ICE Annual Cost", f"₹{cost_comparison['ice_annual_cost']*100:,.0f}"),
+        ("Annual Savings", f"₹{cost_comparison['annual_savings']*100:,.0f}"),
+        ("Monthly Savings", f"₹{cost_comparison['monthly_savings']*100:,.0f}"),
+    ])
+
+health_section(ev)
+st.markdown("---")
+range_section()
+st.markdown("---")
+charging_section()
 st.markdown("---")
-st.header("💰 Cost Comparison: EV vs ICE")
-col1, col2 = st.columns(2)
-with col1:
-    annual_km = st.number_input("Annual Distance (km)", 5000, 50000, 15000, 1000)
-    petrol_price = st.number_input("Petrol Price (₹/L)", 50.0, 200.0, 110.0, 5.0)
-with col2:
-    electricity_price = st.number_input("Electricity Price (₹/kWh)", 2.0, 20.0, 8.0, 0.5)
-    ice_efficiency = st.number_input("ICE Efficiency (km/L)", 5.0, 30.0, 15.0, 1.0)
-
-cost_comparison = ev.compare_ev_vs_ice(annual_km=annual_km, petrol_price_per_liter=petrol_price/100, electricity_price_per_kwh=electricity_price/100, ice_fuel_efficiency=ice_efficiency)
-col1, col2, col3, col4 = st.columns(4)
-with col1: st.metric("EV Annual Cost", f"₹{cost_comparison['ev_annual_cost']*100:,.0f}")
-with col2: st.metric("ICE Annual Cost", f"₹{cost_comparison['ice_annual_cost']*100:,.0f}")
-with col3: st.metric("Annual Savings", f"₹{cost_comparison['annual_savings']*100:,.0f}")
-with col4: st.metric("Monthly Savings", f"₹{cost_comparison['monthly_savings']*100:,.0f}")
+cost_section()
 
 st.markdown("---")
 st.header("💡 Battery Care Recommendations")
-recommendations = ev.optimal_charging_recommendation()
+recommendations = ev.optimal_charging_recommendation(st.session_state.current_charge)
 for rec in recommendations:
     st.info(rec)
 
@@ -1,5 +1,275 @@
 import datetime
 import math
+from bisect import bisect_left, bisect_right
+from typing import Optional
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional - kernels run as plain Python
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        return lambda func: func
+
+# Speed bands (km/h, upper bound inclusive) -> consumption factor
+_SPEED_THR = (50, 80, 110)
+_SPEED_F = (0.85, 1.0, 1.25, 1.5)
+
+# Temperature bands (°C) -> consumption factor. Cold bands are lower-bound
+# inclusive but the hot band starts strictly above 35, hence nextafter.
+_TEMP_THR = (0, 10, math.nextafter(35, math.inf))
+_TEMP_F = (1.4, 1.25, 1.0, 1.15)
+
+# Driving style / terrain -> consumption factor (unknown keys count as 1.0)
+_STYLE_FACTORS = {
+    'eco': 0.85,
+    'normal': 1.0,
+    'sport': 1.3
+}
+_TERRAIN_FACTORS = {
+    'flat': 1.0,
+    'hilly': 1.2,
+    'mountain': 1.4
+}
+
+# Charger power bands (kW, upper bound inclusive) -> charger type
+_CHRG_THR = (3.7, 11, 60)
+_CHRG_NAMES = (
+    "Level 1 (Home - Standard)",
+    "Level 2 (Home - Fast)",
+    "DC Fast Charger",
+    "Ultra-Fast DC Charger"
+)
+
+# SOH bands (%, lower bound inclusive) -> health status, worst first
+_SOH_THR = (75, 85, 95)
+_SOH_NAMES = ("Poor - Consider replacement", "Fair", "Good", "Excellent")
+
+# Advice that applies at every charge level
+_STATIC_RECS = (
+    "💡 Ideal daily range: 20% - 80% charge",
+    "🔌 Use slow charging when possible - Reduces heat stress",
+    "🌡️ Avoid extreme temperatures while charging",
+    "⚡ Fast charging: Use only when necessary (<20% of charges)"
+)
+
+# Charger options offered by the Streamlit app (label -> power in kW)
+CHARGER_POWERS = {
+    "Home (3.7 kW)": 3.7,
+    "Fast Home (7.4 kW)": 7.4,
+    "DC Fast (50 kW)": 50,
+    "Ultra-Fast (150 kW)": 150
+}
+
+# Pure compute functions - take only scalar inputs so callers (e.g. the
+# Streamlit app) can memoize them; EVBatterySystem delegates to these.
+
+def _consumption_per_100km(speed_kmh: float = 60, temperature_c: float = 25,
+                           ac_usage: bool = False, driving_style: str = 'normal',
+                           terrain: str = 'flat') -> float:
+    """Energy consumption (kWh per 100km) under the given driving conditions"""
+    # Base consumption (kWh per 100km) - typical for mid-size EV
+    base_consumption = 15
+    
+    # Speed impact
+    speed_factor = _SPEED_F[bisect_left(_SPEED_THR, speed_kmh)]
+    
+    # Temperature impact
+    temp_factor = _TEMP_F[bisect_right(_TEMP_THR, temperature_c)]
+    
+    # AC usage impact
+    ac_factor = 1.15 if ac_usage else 1.0
+    
+    # Driving style impact
+    style_factor = _STYLE_FACTORS.get(driving_style, 1.0)
+    
+    # Terrain impact
+    terrain_factor = _TERRAIN_FACTORS.get(terrain, 1.0)
+    
+    # Calculate total consumption
+    return (base_consumption * speed_factor * temp_factor * 
+            ac_factor * style_factor * terrain_factor)
+
+def capacity_per_percent(battery_capacity: float, soh: float) -> float:
+    """Usable energy (kWh) per 1% of charge for a battery of the given capacity and SOH"""
+    return battery_capacity * soh / 10000
+
+def compute_range(capacity_per_pct: float, current_charge: float,
+                  speed_kmh: float = 60, temperature_c: float = 25, ac_usage: bool = False,
+                  driving_style: str = 'normal', terrain: str = 'flat') -> dict:
+    """
+    Predict vehicle range based on various conditions
+    capacity_per_pct: Usable kWh per 1% of charge (see capacity_per_percent)
+    current_charge: Current charge percentage
+    """
+    total_consumption = _consumption_per_100km(speed_kmh, temperature_c, ac_usage,
+                                               driving_style, terrain)
+    
+    # Calculate range
+    usable_capacity = capacity_per_pct * current_charge
+    predicted_range = (usable_capacity / total_consumption) * 100
+    
+    return {
+        'range_km': predicted_range,
+        'consumption_per_100km': total_consumption,
+        'available_energy_kwh': usable_capacity
+    }
+
+def compute_range_batch(capacity_per_pct: float, current_charge: float,
+                        speeds, temperatures, ac_usage: bool = False,
+                        driving_style: str = 'normal', terrain: str = 'flat') -> dict:
+    """
+    Predict range over a grid of speeds x temperatures in one vectorized pass
+    speeds: Sequence of average speeds (km/h) - rows of the result
+    temperatures: Sequence of outside temperatures (°C) - columns of the result
+    """
+    import numpy as np
+    
+    speeds = np.atleast_1d(np.asarray(speeds, dtype=float))
+    temperatures = np.atleast_1d(np.asarray(temperatures, dtype=float))
+    
+    speed_factor = np.array(_SPEED_F)[np.searchsorted(_SPEED_THR, speeds, side='left')]
+    temp_factor = np.array(_TEMP_F)[np.searchsorted(_TEMP_THR, temperatures, side='right')]
+    
+    base_consumption = 15
+    ac_factor = 1.15 if ac_usage else 1.0
+    style_factor = _STYLE_FACTORS.get(driving_style, 1.0)
+    terrain_factor = _TERRAIN_FACTORS.get(terrain, 1.0)
+    
+    total_consumption = (base_consumption * speed_factor[:, None] * temp_factor[None, :] *
+                         ac_factor * style_factor * terrain_factor)
+    
+    usable_capacity = capacity_per_pct * current_charge
+    
+    return {
+        'range_km': usable_capacity / total_consumption * 100,
+        'consumption_per_100km': total_consumption,
+        'available_energy_kwh': usable_capacity
+    }
+
+def compute_charging_time(capacity_per_pct: float, current_charge: float,
+                          target_charge: float = 100, charger_power_kw: float = 7.4) -> dict:
+    """
+    Calculate time needed to charge battery
+    capacity_per_pct: Usable kWh per 1% of charge (see capacity_per_percent)
+    charger_power_kw: Charger power (3.7kW home, 7.4kW fast home, 50kW DC fast, 150kW ultra-fast)
+    """
+    energy_needed = capacity_per_pct * (target_charge - current_charge)
+    
+    if energy_needed <= 0:
+        return {
+            'charging_time_hours': 0,
+            'charging_time_minutes': 0,
+            'energy_added_kwh': 0,
+            'message': 'Battery already at or above target charge'
+        }
+    
+    # Charging efficiency (typically 85-90%)
+    efficiency = 0.88
+    actual_energy_needed = energy_needed / efficiency
+    
+    charging_time_hours = actual_energy_needed / charger_power_kw
+    charging_time_minutes = charging_time_hours * 60
+    
+    return {
+        'charging_time_hours': charging_time_hours,
+        'charging_time_minutes': charging_time_minutes,
+        'energy_added_kwh': energy_needed,
+        'charger_type': _get_charger_type(charger_power_kw)
+    }
+
+def _get_charger_type(power_kw: float) -> str:
+    """Identify charger type based on power"""
+    return _CHRG_NAMES[bisect_left(_CHRG_THR, power_kw)]
+
+@njit(cache=True)
+def _degradation_core(years_used: float, avg_cycles_per_year: float,
+                      fast_charge_percentage: float) -> tuple[float, float, float]:
+    """Return (soh, total_degradation, total_cycles) for the given usage"""
+    total_cycles = years_used * avg_cycles_per_year
+    
+    # Base degradation: 2-3% per year typical
+    time_degradation = years_used * 2.5
+    
+    # Cycle degradation: increases with more cycles
+    cycle_degradation = (total_cycles / 1000) * 1.5
+    
+    # Fast charging impact: additional degradation
+    fast_charge_impact = (fast_charge_percentage / 100) * years_used * 1.2
+    
+    # Cap at realistic values: max 30% degradation, minimum 70% SOH
+    total_degradation = min(30.0, time_degradation + cycle_degradation + fast_charge_impact)
+    soh = max(70.0, 100.0 - total_degradation)
+    
+    return soh, total_degradation, total_cycles
+
+def _degradation_report(soh: float, total_degradation: float, total_cycles: float) -> dict:
+    """Build the degradation result dict"""
+    return {
+        'current_soh': soh,
+        'degradation_percentage': total_degradation,
+        'estimated_remaining_cycles': max(0.0, 2000 - total_cycles),
+        'health_status': _get_health_status(soh)
+    }
+
+def compute_degradation(years_used: float, avg_cycles_per_year: float = 200,
+                        fast_charge_percentage: float = 30) -> dict:
+    """
+    Estimate battery degradation over time
+    years_used: How many years the battery has been used
+    avg_cycles_per_year: Average charge cycles per year
+    fast_charge_percentage: Percentage of fast charging usage
+    """
+    return _degradation_report(*_degradation_core(float(years_used), float(avg_cycles_per_year),
+                                                  float(fast_charge_percentage)))
+
+def _get_health_status(soh: float) -> str:
+    """Determine battery health status"""
+    return _SOH_NAMES[bisect_right(_SOH_THR, soh)]
+
+@njit(cache=True)
+def _cost_core(annual_km: float, ev_consumption_per_100km: float,
+               petrol_price_per_liter: float, electricity_price_per_kwh: float,
+               ice_fuel_efficiency: float) -> tuple[float, float, float, float]:
+    """Return (ev_cost, ice_cost, annual_savings, monthly_savings) per year"""
+    # EV costs
+    ev_energy_per_year = (annual_km / 100) * ev_consumption_per_100km
+    ev_fuel_cost_per_year = ev_energy_per_year * electricity_price_per_kwh
+    
+    # ICE costs
+    ice_liters_per_year = annual_km / ice_fuel_efficiency
+    ice_fuel_cost_per_year = ice_liters_per_year * petrol_price_per_liter
+    
+    # Savings
+    annual_savings = ice_fuel_cost_per_year - ev_fuel_cost_per_year
+    monthly_savings = annual_savings / 12
+    
+    return ev_fuel_cost_per_year, ice_fuel_cost_per_year, annual_savings, monthly_savings
+
+def compute_cost_comparison(annual_km: float = 15000, petrol_price_per_liter: float = 1.8,
+                            electricity_price_per_kwh: float = 0.15,
+                            ice_fuel_efficiency: float = 15) -> dict:
+    """
+    Compare EV costs vs Internal Combustion Engine vehicle
+    annual_km: Kilometers driven per year
+    petrol_price_per_liter: Current petrol price
+    electricity_price_per_kwh: Electricity cost
+    ice_fuel_efficiency: ICE vehicle fuel efficiency (km per liter)
+    """
+    # EV consumption at default driving conditions
+    ev_consumption_per_100km = _consumption_per_100km()
+    ev_fuel_cost_per_year, ice_fuel_cost_per_year, annual_savings, monthly_savings = _cost_core(
+        annual_km, ev_consumption_per_100km, petrol_price_per_liter,
+        electricity_price_per_kwh, ice_fuel_efficiency
+    )
+    
+    return {
+        'ev_annual_cost': ev_fuel_cost_per_year,
+        'ice_annual_cost': ice_fuel_cost_per_year,
+        'annual_savings': annual_savings,
+        'monthly_savings': monthly_savings,
+        'savings_percentage': (annual_savings / ice_fuel_cost_per_year) * 100,
+        'ev_cost_per_km': ev_fuel_cost_per_year / annual_km,
+        'ice_cost_per_km': ice_fuel_cost_per_year / annual_km
+    }
 
 class EVBatterySystem:
     """
@@ -7,170 +277,109 @@ class EVBatterySystem:
     Analyzes battery health, predicts range, and optimizes charging
     """
     
-    def __init__(self, battery_capacity_kwh, initial_soh=100):
+    def __init__(self, battery_capacity_kwh: float, initial_soh: float = 100) -> None:
         """
         Initialize the EV Battery System
         battery_capacity_kwh: Total battery capacity in kWh (e.g., 60 for 60kWh battery)
         initial_soh: State of Health percentage (100 = new battery)
         """
-        self.battery_capacity = battery_capacity_kwh
+        self._battery_capacity = battery_capacity_kwh
         self.soh = initial_soh  # State of Health
-        self.current_charge = 100  # Current charge percentage
+        self.current_charge: float = 100  # Current charge percentage
+    
+    # Usable kWh per 1% of charge is refreshed whenever capacity or SOH changes,
+    # so the per-call paths need a single multiply
+    @property
+    def battery_capacity(self) -> float:
+        return self._battery_capacity
+    
+    @battery_capacity.setter
+    def battery_capacity(self, value: float) -> None:
+        self._battery_capacity = value
+        self._cap_per_pct = capacity_per_percent(value, self._soh)
+    
+    @property
+    def soh(self) -> float:
+        return self._soh
+    
+    @soh.setter
+    def soh(self, value: float) -> None:
+        self._soh = value
+        self._cap_per_pct = capacity_per_percent(self._battery_capacity, value)
+    
+    def _capacity_per_pct(self, soh: Optional[float]) -> float:
+        """Cached kWh per 1% of charge, or recomputed for an SOH override"""
+        if soh is None:
+            return self._cap_per_pct
+        return capacity_per_percent(self._battery_capacity, soh)
         
-    def calculate_available_capacity(self):
+    def calculate_available_capacity(self, soh: Optional[float] = None) -> float:
         """Calculate actual available capacity based on battery health"""
-        return (self.battery_capacity * self.soh) / 100
+        return self._capacity_per_pct(soh) * 100
     
-    def predict_range(self, speed_kmh=60, temperature_c=25, ac_usage=False, 
-                     driving_style='normal', terrain='flat'):
+    def predict_range(self, speed_kmh: float = 60, temperature_c: float = 25,
+                      ac_usage: bool = False, driving_style: str = 'normal',
+                      terrain: str = 'flat', soh: Optional[float] = None,
+                      current_charge: Optional[float] = None) -> dict:
         """
         Predict vehicle range based on various conditions
+        soh, current_charge: Override the stored battery state for this call
         """
-        # Base consumption (kWh per 100km) - typical for mid-size EV
-        base_consumption = 15
-        
-        # Speed impact
-        if speed_kmh <= 50:
-            speed_factor = 0.85
-        elif speed_kmh <= 80:
-            speed_factor = 1.0
-        elif speed_kmh <= 110:
-            speed_factor = 1.25
-        else:
-            speed_factor = 1.5
-        
-        # Temperature impact
-        if temperature_c < 0:
-            temp_factor = 1.4
-        elif temperature_c < 10:
-            temp_factor = 1.25
-        elif temperature_c > 35:
-            temp_factor = 1.15
-        else:
-            temp_factor = 1.0
-        
-        # AC usage impact
-        ac_factor = 1.15 if ac_usage else 1.0
-        
-        # Driving style impact
-        style_factors = {
-            'eco': 0.85,
-            'normal': 1.0,
-            'sport': 1.3
-        }
-        style_factor = style_factors.get(driving_style, 1.0)
-        
-        # Terrain impact
-        terrain_factors = {
-            'flat': 1.0,
-            'hilly': 1.2,
-            'mountain': 1.4
-        }
-        terrain_factor = terrain_factors.get(terrain, 1.0)
-        
-        # Calculate total consumption
-        total_consumption = (base_consumption * speed_factor * temp_factor * 
-                           ac_factor * style_factor * terrain_factor)
-        
-        # Calculate range
-        available_capacity = self.calculate_available_capacity()
-        usable_capacity = (available_capacity * self.current_charge) / 100
-        predicted_range = (usable_capacity / total_consumption) * 100
-        
-        return {
-            'range_km': round(predicted_range, 2),
-            'consumption_per_100km': round(total_consumption, 2),
-            'available_energy_kwh': round(usable_capacity, 2)
-        }
-    def calculate_charging_time(self, target_charge=100, charger_power_kw=7.4):
+        return compute_range(
+            self._capacity_per_pct(soh),
+            self.current_charge if current_charge is None else current_charge,
+            speed_kmh, temperature_c, ac_usage, driving_style, terrain
+        )
+    
+    def predict_range_batch(self, speeds, temperatures, ac_usage: bool = False,
+                            driving_style: str = 'normal', terrain: str = 'flat',
+                            soh: Optional[float] = None,
+                            current_charge: Optional[float] = None) -> dict:
+        """
+        Predict range for every speed x temperature combination (NumPy arrays)
+        soh, current_charge: Override the stored battery state for this call
+        """
+        return compute_range_batch(
+            self._capacity_per_pct(soh),
+            self.current_charge if current_charge is None else current_charge,
+            speeds, temperatures, ac_usage, driving_style, terrain
+        )
+    
+    def calculate_charging_time(self, target_charge: float = 100, charger_power_kw: float = 7.4,
+                                soh: Optional[float] = None,
+                                current_charge: Optional[float] = None) -> dict:
         """
         Calculate time needed to charge battery
         charger_power_kw: Charger power (3.7kW home, 7.4kW fast home, 50kW DC fast, 150kW ultra-fast)
+        soh, current_charge: Override the stored battery state for this call
         """
-        current_energy = (self.calculate_available_capacity() * self.current_charge) / 100
-        target_energy = (self.calculate_available_capacity() * target_charge) / 100
-        energy_needed = target_energy - current_energy
-        
-        if energy_needed <= 0:
-            return {
-                'charging_time_hours': 0,
-                'charging_time_minutes': 0,
-                'energy_added_kwh': 0,
-                'message': 'Battery already at or above target charge'
-            }
-        
-        # Charging efficiency (typically 85-90%)
-        efficiency = 0.88
-        actual_energy_needed = energy_needed / efficiency
-        
-        charging_time_hours = actual_energy_needed / charger_power_kw
-        charging_time_minutes = charging_time_hours * 60
-        
-        return {
-            'charging_time_hours': round(charging_time_hours, 2),
-            'charging_time_minutes': round(charging_time_minutes, 1),
-            'energy_added_kwh': round(energy_needed, 2),
-            'charger_type': self._get_charger_type(charger_power_kw)
-        }
+        return compute_charging_time(
+            self._capacity_per_pct(soh),
+            self.current_charge if current_charge is None else current_charge,
+            target_charge, charger_power_kw
+        )
     
-    def _get_charger_type(self, power_kw):
-        """Identify charger type based on power"""
-        if power_kw <= 3.7:
-            return "Level 1 (Home - Standard)"
-        elif power_kw <= 11:
-            return "Level 2 (Home - Fast)"
-        elif power_kw <= 60:
-            return "DC Fast Charger"
-        else:
-            return "Ultra-Fast DC Charger"
-    
-    def calculate_battery_degradation(self, years_used, avg_cycles_per_year=200, 
-                                     fast_charge_percentage=30):
+    def calculate_battery_degradation(self, years_used: float, avg_cycles_per_year: float = 200,
+                                      fast_charge_percentage: float = 30,
+                                      update_soh: bool = True) -> dict:
         """
         Estimate battery degradation over time
         years_used: How many years the battery has been used
         avg_cycles_per_year: Average charge cycles per year
         fast_charge_percentage: Percentage of fast charging usage
+        update_soh: Store the estimated SOH on the instance (False leaves it untouched)
         """
-        total_cycles = years_used * avg_cycles_per_year
-        
-        # Base degradation: 2-3% per year typical
-        time_degradation = years_used * 2.5
-        
-        # Cycle degradation: increases with more cycles
-        cycle_degradation = (total_cycles / 1000) * 1.5
-        
-        # Fast charging impact: additional degradation
-        fast_charge_impact = (fast_charge_percentage / 100) * years_used * 1.2
-        
-        total_degradation = time_degradation + cycle_degradation + fast_charge_impact
-        
-        # Cap at realistic values
-        total_degradation = min(total_degradation, 30)  # Max 30% degradation
-        
-        new_soh = 100 - total_degradation
-        self.soh = max(new_soh, 70)  # Minimum 70% SOH
+        soh, total_degradation, total_cycles = _degradation_core(
+            float(years_used), float(avg_cycles_per_year), float(fast_charge_percentage)
+        )
+        if update_soh:
+            self.soh = soh
         
-        return {
-            'current_soh': round(self.soh, 1),
-            'degradation_percentage': round(total_degradation, 1),
-            'estimated_remaining_cycles': max(0, 2000 - total_cycles),
-            'health_status': self._get_health_status(self.soh)
-        }
+        return _degradation_report(soh, total_degradation, total_cycles)
     
-    def _get_health_status(self, soh):
-        """Determine battery health status"""
-        if soh >= 95:
-            return "Excellent"
-        elif soh >= 85:
-            return "Good"
-        elif soh >= 75:
-            return "Fair"
-        else:
-            return "Poor - Consider replacement"
-    
-    def compare_ev_vs_ice(self, annual_km=15000, petrol_price_per_liter=1.8, 
-                         electricity_price_per_kwh=0.15, ice_fuel_efficiency=15):
+    def compare_ev_vs_ice(self, annual_km: float = 15000, petrol_price_per_liter: float = 1.8,
+                          electricity_price_per_kwh: float = 0.15,
+                          ice_fuel_efficiency: float = 15) -> dict:
         """
         Compare EV costs vs Internal Combustion Engine vehicle
         annual_km: Kilometers driven per year
@@ -178,64 +387,45 @@ class EVBatterySystem:
         electricity_price_per_kwh: Electricity cost
         ice_fuel_efficiency: ICE vehicle fuel efficiency (km per liter)
         """
-        # EV costs
-        range_data = self.predict_range()
-        ev_consumption_per_100km = range_data['consumption_per_100km']
-        ev_energy_per_year = (annual_km / 100) * ev_consumption_per_100km
-        ev_fuel_cost_per_year = ev_energy_per_year * electricity_price_per_kwh
-        
-        # ICE costs
-        ice_liters_per_year = annual_km / ice_fuel_efficiency
-        ice_fuel_cost_per_year = ice_liters_per_year * petrol_price_per_liter
-        
-        # Savings
-        annual_savings = ice_fuel_cost_per_year - ev_fuel_cost_per_year
-        monthly_savings = annual_savings / 12
-        
-        return {
-            'ev_annual_cost': round(ev_fuel_cost_per_year, 2),
-            'ice_annual_cost': round(ice_fuel_cost_per_year, 2),
-            'annual_savings': round(annual_savings, 2),
-            'monthly_savings': round(monthly_savings, 2),
-            'savings_percentage': round((annual_savings / ice_fuel_cost_per_year) * 100, 1),
-            'ev_cost_per_km': round(ev_fuel_cost_per_year / annual_km, 3),
-            'ice_cost_per_km': round(ice_fuel_cost_per_year / annual_km, 3)
-        }
+        return compute_cost_comparison(annual_km, petrol_price_per_liter,
+                                       electricity_price_per_kwh, ice_fuel_efficiency)
     
-    def optimal_charging_recommendation(self):
+    def optimal_charging_recommendation(self, current_charge: Optional[float] = None) -> list[str]:
         """Provide optimal charging recommendations for battery longevity"""
+        if current_charge is None:
+            current_charge = self.current_charge
+        
         recommendations = []
         
-        if self.current_charge < 20:
+        if current_charge < 20:
             recommendations.append("⚠️ Charge soon - Low battery can stress cells")
         
-        if self.current_charge > 90:
+        if current_charge > 90:
             recommendations.append("✓ Avoid charging to 100% daily - Keep between 20-80% for longevity")
         
-        recommendations.append("💡 Ideal daily range: 20% - 80% charge")
-        recommendations.append("🔌 Use slow charging when possible - Reduces heat stress")
-        recommendations.append("🌡️ Avoid extreme temperatures while charging")
-        recommendations.append("⚡ Fast charging: Use only when necessary (<20% of charges)")
+        recommendations.extend(_STATIC_RECS)
         
         return recommendations
     # Main Program - User Interface
-def print_header(text):
+def print_header(text: str) -> None:
     """Print formatted header"""
     print("\n" + "="*60)
     print(f"  {text}")
     print("="*60)
 
-def print_section(text):
+def print_section(text: str) -> None:
     """Print formatted section"""
     print(f"\n--- {text} ---")
 
-def display_dict(data, indent=2):
+def display_dict(data: dict, indent: int = 2) -> None:
     """Display dictionary in readable format"""
     for key, value in data.items():
         formatted_key = key.replace('_', ' ').title()
+        if isinstance(value, float):
+            value = f"{value:.2f}"
         print(" " * indent + f"{formatted_key}: {value}")
 
-def main():
+def main() -> None:
     """Main program execution"""
     print_header("🔋 EV BATTERY INTELLIGENCE SYSTEM 🔋")
     print("      Advanced Battery Management & Range Optimization")
@@ -338,7 +528,7 @@ def main():
         print(f"  ICE Annual Cost: ₹{cost_comparison['ice_annual_cost'] * 100:.2f}")
         print(f"  Annual Savings: ₹{cost_comparison['annual_savings'] * 100:.2f}")
         print(f"  Monthly Savings: ₹{cost_comparison['monthly_savings'] * 100:.2f}")
-        print(f"  Savings Percentage: {cost_comparison['savings_percentage']}%")
+        print(f"  Savings Percentage: {cost_comparison['savings_percentage']:.1f}%")
         print(f"  EV Cost per km: ₹{cost_comparison['ev_cost_per_km'] * 100:.3f}")
         print(f"  ICE Cost per km: ₹{cost_comparison['ice_cost_per_km'] * 100:.3f}")
         
@@ -353,7 +543,7 @@ def main():
         print(f"  Battery Capacity: {battery_capacity} kWh")
         print(f"  Current State of Health: {ev.soh:.1f}%")
         print(f"  Current Charge: {ev.current_charge}%")
-        print(f"  Predicted Range: {range_data['range_km']} km")
+        print(f"  Predicted Range: {range_data['range_km']:.2f} km")
         print(f"  Annual Fuel Savings: ₹{cost_comparison['annual_savings'] * 100:.2f}")
         
         print("\n" + "="*60)